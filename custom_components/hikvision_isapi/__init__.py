@@ -23,7 +23,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         password=entry.data[CONF_PASSWORD],
     )
 
-    # Validate connection and get device info
+    # Validate connection and get device info. This first request also primes
+    # the client's digest challenge, so later polls and PUTs skip the 401.
     device_info = await client.get_device_info()
 
     coordinator = HikvisionISAPICoordinator(hass, client, device_info)
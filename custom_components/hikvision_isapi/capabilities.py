@@ -13,47 +13,74 @@ Nested XML paths are flattened with "/" separators for entity addressing:
 
 from __future__ import annotations
 
-import xml.etree.ElementTree as ET
+from collections import ChainMap
+import io
+import re
+import sys
 from dataclasses import dataclass, field
-from enum import Enum
-from typing import Dict, List, Optional, Set
+from enum import IntEnum
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Mapping, Optional, Set
 
-ISAPI_NS = "http://www.hikvision.com/ver20/XMLSchema"
+try:
+    from lxml import etree as ET
 
-# Human-readable names for Hikvision ISAPI values
-FRIENDLY_NAMES: dict[str, str] = {
-    # On/Off conventions
-    "open": "On",
-    "close": "Off",
-    # Noise reduction
+    _LXML = True
+except ImportError:  # lxml is optional — fall back to the stdlib parser
+    import xml.etree.ElementTree as ET
+
+    _LXML = False
+
+ISAPI_NS = "http://www.hikvision.com/ver20/XMLSchema"
+_NS_PREFIX = "{" + ISAPI_NS + "}"
+_NS_LEN = len(_NS_PREFIX)
+# Namespaced tag → local name, filled in by _strip_ns. Bounded in practice by
+# the camera's schema vocabulary.
+_STRIPPED_TAGS: dict[str, str] = {}
+
+# Human-readable names for Hikvision ISAPI values, split by the top-level
+# section (first path segment) they belong to. Section tables are consulted
+# first so the same raw value can read differently per feature.
+_NOISE_REDUCE_NAMES: dict[str, str] = {
     "general": "Normal",
-    # Supplement light
+}
+_SUPPLEMENT_LIGHT_NAMES: dict[str, str] = {
     "colorVuWhiteLight": "White Light",
     "irLight": "IR",
-    # White balance
+}
+_WHITE_BALANCE_NAMES: dict[str, str] = {
     "auto1": "Auto 1",
     "auto2": "Auto 2",
     "daylightLamp": "Fluorescent",
     "incandescentlight": "Incandescent",
     "warmlight": "Warm Light",
     "naturallight": "Natural Light",
-    # Exposure / iris
+}
+_EXPOSURE_NAMES: dict[str, str] = {
     "pIris-General": "P-Iris",
-    # Power line
+}
+_POWER_LINE_NAMES: dict[str, str] = {
     "50hz": "50 Hz",
     "60hz": "60 Hz",
-    # Focus
+}
+_FOCUS_NAMES: dict[str, str] = {
     "SEMIAUTOMATIC": "Semi-automatic",
     "AUTO": "Auto",
     "MANUAL": "Manual",
-    # BLC modes
+}
+_BLC_NAMES: dict[str, str] = {
     "CLOSE": "Off",
     "LEFTRIGHT": "Left-Right",
     "UPDOWN": "Up-Down",
     "CENTER": "Center",
     "Region": "Region",
     "AUTO": "Auto",
-    # Generic
+}
+_GENERIC_NAMES: dict[str, str] = {
+    # On/Off conventions
+    "open": "On",
+    "close": "Off",
     "true": "On",
     "false": "Off",
     "manual": "Manual",
@@ -67,6 +94,28 @@ FRIENDLY_NAMES: dict[str, str] = {
     "indoor": "Indoor",
 }
 
+FRIENDLY_NAMES_BY_SECTION: Mapping[str, Mapping[str, str]] = MappingProxyType({
+    "NoiseReduce": MappingProxyType(_NOISE_REDUCE_NAMES),
+    "SupplementLight": MappingProxyType(_SUPPLEMENT_LIGHT_NAMES),
+    "WhiteBalance": MappingProxyType(_WHITE_BALANCE_NAMES),
+    "Exposure": MappingProxyType(_EXPOSURE_NAMES),
+    "powerLineFrequency": MappingProxyType(_POWER_LINE_NAMES),
+    "FocusConfiguration": MappingProxyType(_FOCUS_NAMES),
+    "BLC": MappingProxyType(_BLC_NAMES),
+})
+
+# Read-only view over every table — the section-agnostic fallback
+FRIENDLY_NAMES: Mapping[str, str] = MappingProxyType(ChainMap(
+    _NOISE_REDUCE_NAMES,
+    _SUPPLEMENT_LIGHT_NAMES,
+    _WHITE_BALANCE_NAMES,
+    _EXPOSURE_NAMES,
+    _POWER_LINE_NAMES,
+    _FOCUS_NAMES,
+    _BLC_NAMES,
+    _GENERIC_NAMES,
+))
+
 # Human-readable entity names for known ISAPI paths
 ENTITY_NAMES: dict[str, str] = {
     "WDR/mode": "WDR",
@@ -114,7 +163,7 @@ ENTITY_NAMES: dict[str, str] = {
 }
 
 # Paths to skip — not useful as entities
-SKIP_PATHS = {
+SKIP_PATHS = frozenset({
     "id",
     "enabled",  # top-level channel enabled
     "videoInputID",
@@ -124,22 +173,26 @@ SKIP_PATHS = {
     "isSupportLaserSpotManual",
     "isSupportDOFAdjust",
     "isSupportAntiBandingParams",
-}
+})
+
+
+class EntityType(IntEnum):
+    SWITCH = 0
+    NUMBER = 1
+    SELECT = 2
 
 
-class EntityType(Enum):
-    SWITCH = "switch"
-    NUMBER = "number"
-    SELECT = "select"
+# Option lookups for descriptors without options
+_NO_OPTIONS: Mapping[str, str] = MappingProxyType({})
 
 
-@dataclass
+@dataclass(slots=True)
 class EntityDescriptor:
     path: str  # e.g., "Exposure/OverexposeSuppress/enabled"
     name: str  # e.g., "Smart Supplement Light"
     entity_type: EntityType
-    options: list[str] = field(default_factory=list)  # raw ISAPI values for selects
-    friendly_options: list[str] = field(default_factory=list)  # translated for UI
+    options: tuple[str, ...] = ()  # raw ISAPI values for selects
+    friendly_options: tuple[str, ...] = ()  # translated for UI
     min_value: float | None = None
     max_value: float | None = None
     current_value: str = ""
@@ -147,15 +200,19 @@ class EntityDescriptor:
     # When set, this select controls both the mode and the enabled flag
     linked_enabled_path: str | None = None
     off_value: str | None = None  # Raw value meaning "off" (e.g., "CLOSE")
+    # Read-only lookups between options and friendly_options, shared by every
+    # descriptor with the same options
+    raw_to_friendly: Mapping[str, str] = field(default_factory=lambda: _NO_OPTIONS)
+    friendly_to_raw: Mapping[str, str] = field(default_factory=lambda: _NO_OPTIONS)
 
     def __str__(self) -> str:
-        if self.entity_type == EntityType.SELECT:
+        if self.entity_type is EntityType.SELECT:
             opts = ", ".join(
                 f"{f} ({r})" if f != r else r
                 for r, f in zip(self.options, self.friendly_options)
             )
             return f"[select]  {self.name:<30} = {self.friendly_value:<15} opts: {opts}"
-        elif self.entity_type == EntityType.NUMBER:
+        elif self.entity_type is EntityType.NUMBER:
             return (
                 f"[number]  {self.name:<30} = {self.current_value:<15} "
                 f"range: {self.min_value}–{self.max_value}"
@@ -165,96 +222,147 @@ class EntityDescriptor:
 
     @property
     def friendly_value(self) -> str:
-        return FRIENDLY_NAMES.get(self.current_value, self.current_value)
+        return _friendly_name(self.current_value, self.path)
 
 
 def parse_capabilities(
-    capabilities_xml: ET.Element,
-    current_values_xml: ET.Element | None = None,
+    capabilities_xml: bytes,
+    current_values_xml: bytes | None = None,
 ) -> list[EntityDescriptor]:
     """Parse capabilities XML into a list of entity descriptors.
 
     If current_values_xml is provided, current values are populated from it.
     Otherwise, falls back to the default values embedded in the capabilities XML.
     """
-    entities: list[EntityDescriptor] = []
-    _walk(capabilities_xml, "", entities)
+    entities = _walk(capabilities_xml)
 
+    current_map: dict[str, str] = {}
     if current_values_xml is not None:
         current_map = _build_value_map(current_values_xml)
         for entity in entities:
             if entity.path in current_map:
                 entity.current_value = current_map[entity.path]
 
-    _merge_enabled_mode_patterns(entities, current_map if current_values_xml is not None else {})
+    _merge_enabled_mode_patterns(entities, current_map)
 
     return entities
 
 
-def _walk(
-    element: ET.Element,
-    parent_path: str,
-    entities: list[EntityDescriptor],
-) -> None:
-    """Recursively walk the capabilities XML tree, extracting entity descriptors."""
-    for child in element:
-        tag = _strip_ns(child.tag)
-        path = f"{parent_path}/{tag}" if parent_path else tag
+def _walk(capabilities_xml: bytes) -> list[EntityDescriptor]:
+    """Stream the capabilities XML in a single pass, extracting entity descriptors.
+
+    Descriptors are emitted on an element's start event (its attributes are
+    complete by then) and pick up their default value on the matching end event.
+    """
+    entities: list[EntityDescriptor] = []
+    # One slot per open element: its descriptor, or None if it isn't an entity
+    open_descriptors: list[EntityDescriptor | None] = []
+    # Path of a skipped element — its whole subtree is ignored until it closes
+    skipped: str | None = None
+
+    for event, path, element in _iter_elements(capabilities_xml):
+        if skipped is not None:
+            if event == "end" and path == skipped:
+                skipped = None
+            continue
+
+        if event == "end":
+            entity = open_descriptors.pop()
+            if entity is not None:
+                entity.current_value = (element.text or "").strip()
+            continue
 
         if path in SKIP_PATHS:
+            skipped = path
             continue
 
-        opt = child.attrib.get("opt")
-        min_val = child.attrib.get("min")
-        max_val = child.attrib.get("max")
-
-        if opt is not None:
-            options = [o.strip() for o in opt.split(",")]
-            default_value = (child.text or "").strip()
-
-            if _is_switch(options):
-                entities.append(EntityDescriptor(
-                    path=path,
-                    name=ENTITY_NAMES.get(path, _path_to_name(path)),
-                    entity_type=EntityType.SWITCH,
-                    current_value=default_value,
-                ))
-            elif len(options) > 1:
-                friendly = [FRIENDLY_NAMES.get(o, o) for o in options]
-                entities.append(EntityDescriptor(
-                    path=path,
-                    name=ENTITY_NAMES.get(path, _path_to_name(path)),
-                    entity_type=EntityType.SELECT,
-                    options=options,
-                    friendly_options=friendly,
-                    current_value=default_value,
-                ))
-            # Single-option selects (e.g., ExposureType="manual" on ColorVu) — still
-            # expose them so the discovery output is complete and users can see them.
-            # The integration can decide later whether to hide single-option entities.
-            else:
-                entities.append(EntityDescriptor(
-                    path=path,
-                    name=ENTITY_NAMES.get(path, _path_to_name(path)),
-                    entity_type=EntityType.SELECT,
-                    options=options,
-                    friendly_options=[FRIENDLY_NAMES.get(options[0], options[0])],
-                    current_value=default_value,
-                ))
-        elif min_val is not None and max_val is not None:
-            default_value = (child.text or "").strip()
-            entities.append(EntityDescriptor(
-                path=path,
-                name=ENTITY_NAMES.get(path, _path_to_name(path)),
-                entity_type=EntityType.NUMBER,
-                min_value=float(min_val),
-                max_value=float(max_val),
-                current_value=default_value,
-            ))
-
-        # Recurse into children regardless — there may be nested entities
-        if len(child):
-            _walk(child, path, entities)
+        entity = _describe(path, element.attrib)
+        if entity is not None:
+            entities.append(entity)
+        # Keep walking regardless — there may be nested entities
+        open_descriptors.append(entity)
+
+    return entities
+
+
+def _describe(path: str, attrib: Mapping[str, str]) -> EntityDescriptor | None:
+    """Build the descriptor for an element from its capability attributes."""
+    opt = attrib.get("opt")
+    if opt is not None:
+        options = _parse_opt(opt)
+        if _is_switch(options):
+            return _build_switch(path)
+        return _build_select(path, options)
+
+    min_val = attrib.get("min")
+    max_val = attrib.get("max")
+    if min_val is not None and max_val is not None:
+        return _build_number(path, min_val, max_val)
+    return None
+
+
+def _build_switch(path: str) -> EntityDescriptor:
+    return EntityDescriptor(
+        path=path,
+        name=_resolve_name(path),
+        entity_type=EntityType.SWITCH,
+    )
+
+
+def _build_select(path: str, options: tuple[str, ...]) -> EntityDescriptor:
+    # Single-option selects (e.g., ExposureType="manual" on ColorVu) — still
+    # expose them so the discovery output is complete and users can see them.
+    # The integration can decide later whether to hide single-option entities.
+    # Friendly names depend only on the section, so descriptors with the same
+    # options in the same section share the cached tuple and maps
+    section = path.split("/", 1)[0]
+    raw_to_friendly, friendly_to_raw = _option_maps(options, section)
+    return EntityDescriptor(
+        path=path,
+        name=_resolve_name(path),
+        entity_type=EntityType.SELECT,
+        options=options,
+        friendly_options=_friendly_options(options, section),
+        raw_to_friendly=raw_to_friendly,
+        friendly_to_raw=friendly_to_raw,
+    )
+
+
+def _build_number(path: str, min_val: str, max_val: str) -> EntityDescriptor:
+    return EntityDescriptor(
+        path=path,
+        name=_resolve_name(path),
+        entity_type=EntityType.NUMBER,
+        min_value=float(min_val),
+        max_value=float(max_val),
+    )
+
+
+# Capability XML is deterministic per model, so the same opt strings recur on
+# every reload and across cameras. Descriptors themselves are mutable and are
+# never cached — only the immutable option tuples and maps they are built from.
+@lru_cache(maxsize=512)
+def _parse_opt(opt: str) -> tuple[str, ...]:
+    """Split an opt="a,b,c" attribute into raw option values."""
+    return tuple(o.strip() for o in opt.split(","))
+
+
+@lru_cache(maxsize=512)
+def _friendly_options(options: tuple[str, ...], section: str) -> tuple[str, ...]:
+    """Translate raw option values for display within a top-level section."""
+    return tuple(_friendly_name(o, section) for o in options)
+
+
+@lru_cache(maxsize=512)
+def _option_maps(
+    options: tuple[str, ...], section: str
+) -> tuple[Mapping[str, str], Mapping[str, str]]:
+    """Build read-only raw → friendly and friendly → raw option lookups."""
+    friendly = _friendly_options(options, section)
+    return (
+        MappingProxyType(dict(zip(options, friendly))),
+        MappingProxyType(dict(zip(friendly, options))),
+    )
 
 
 # Values in mode selects that mean "off" — used to detect merged enabled+mode patterns
@@ -281,9 +389,9 @@ def _merge_enabled_mode_patterns(
         if len(parts) != 2:
             continue
         parent, leaf = parts
-        if e.entity_type == EntityType.SWITCH and leaf == "enabled":
+        if e.entity_type is EntityType.SWITCH and leaf == "enabled":
             switches_by_parent[parent] = e
-        elif e.entity_type == EntityType.SELECT:
+        elif e.entity_type is EntityType.SELECT:
             off_vals = [o for o in e.options if o in MODE_OFF_VALUES]
             if off_vals:
                 selects_by_parent[parent] = (e, off_vals[0])
@@ -305,34 +413,124 @@ def _merge_enabled_mode_patterns(
 
         to_remove.append(switch)
 
-    for e in to_remove:
-        entities.remove(e)
+    # Filter by identity in one pass — list.remove() per item is quadratic
+    # and compares by value, which can hit the wrong descriptor
+    remove_ids = {id(e) for e in to_remove}
+    entities[:] = [e for e in entities if id(e) not in remove_ids]
 
 
-def _build_value_map(root: ET.Element, parent_path: str = "") -> dict[str, str]:
+def _build_value_map(values_xml: bytes) -> dict[str, str]:
     """Flatten current-values XML into a {path: value} dict."""
     values: dict[str, str] = {}
-    for child in root:
-        tag = _strip_ns(child.tag)
-        path = f"{parent_path}/{tag}" if parent_path else tag
-        if child.text and child.text.strip() and not len(child):
-            values[path] = child.text.strip()
-        if len(child):
-            values.update(_build_value_map(child, path))
+    for event, path, element in _iter_elements(values_xml):
+        if event == "end" and not len(element):
+            text = element.text
+            if text and (text := text.strip()):
+                values[path] = text
     return values
 
 
+def _iter_elements(xml_bytes: bytes) -> Iterator[tuple[str, str, ET.Element]]:
+    """Stream (event, path, element) for every element below the root.
+
+    Driven by iterparse, so no full tree is built: each element is released
+    once its "end" event has been handled by the caller.
+    """
+    # Full path of each open element, so a child's path is one concatenation
+    # onto its parent's rather than a join over the whole stack. The root
+    # element sits at the bottom with an empty path.
+    path_stack: list[str] = []
+    # Runs once per element per poll — bind hot callables to locals
+    push, pop = path_stack.append, path_stack.pop
+    strip_ns, intern, release = _strip_ns, sys.intern, _release
+    for event, element in _iterparse(xml_bytes):
+        if event == "start":
+            if not path_stack:
+                push("")
+                continue
+            parent_path = path_stack[-1]
+            tag = strip_ns(element.tag)
+            # Interned: paths are long-lived dict keys (value maps, descriptor
+            # index), so the hash is cached and lookups can hit on identity
+            path = intern(f"{parent_path}/{tag}" if parent_path else tag)
+            push(path)
+            yield event, path, element
+        else:
+            path = pop()
+            if path:
+                yield event, path, element
+            release(element)
+
+
+def _iterparse(xml_bytes: bytes) -> Iterator[tuple[str, ET.Element]]:
+    """Iterate start/end events over XML bytes with whichever parser is loaded."""
+    if _LXML:
+        return ET.iterparse(
+            io.BytesIO(xml_bytes),
+            events=("start", "end"),
+            huge_tree=False,
+            remove_blank_text=True,
+            remove_comments=True,
+            remove_pis=True,
+            resolve_entities=False,
+        )
+    return ET.iterparse(io.BytesIO(xml_bytes), events=("start", "end"))
+
+
+def _release(element: ET.Element) -> None:
+    """Free a fully-processed element (and, with lxml, its earlier siblings)."""
+    element.clear()
+    if _LXML:
+        while element.getprevious() is not None:
+            del element.getparent()[0]
+
+
+def _friendly_name(value: str, path: str) -> str:
+    """Translate a raw ISAPI value, preferring the table for the path's section."""
+    section = FRIENDLY_NAMES_BY_SECTION.get(path.split("/", 1)[0])
+    if section is not None and value in section:
+        return section[value]
+    return FRIENDLY_NAMES.get(value, value)
+
+
 def _strip_ns(tag: str) -> str:
-    """Strip XML namespace from a tag: {http://...}Tag → Tag."""
-    if tag.startswith("{"):
-        return tag.split("}", 1)[1]
-    return tag
+    """Strip XML namespace from a tag: {http://...}Tag → Tag.
+
+    Called for every element on every poll and every write, and a camera only
+    uses a few hundred distinct tags — so each is stripped once (a prefix
+    slice for the common ISAPI namespace) and then resolved by dict lookup.
+    """
+    stripped = _STRIPPED_TAGS.get(tag)
+    if stripped is None:
+        if tag.startswith(_NS_PREFIX):
+            stripped = tag[_NS_LEN:]
+        elif tag.startswith("{"):
+            stripped = tag.split("}", 1)[1]
+        else:
+            stripped = tag
+        _STRIPPED_TAGS[tag] = stripped
+    return stripped
 
 
-def _is_switch(options: list[str]) -> bool:
+_BOOL_PAIR = ("false", "true")
+
+
+def _is_switch(options: tuple[str, ...]) -> bool:
     """Check if options represent a boolean switch."""
-    normalized = {o.lower() for o in options}
-    return normalized == {"true", "false"}
+    if len(options) != 2:
+        return False
+    a, b = options[0].lower(), options[1].lower()
+    return (a, b) == _BOOL_PAIR or (b, a) == _BOOL_PAIR
+
+
+@lru_cache(maxsize=512)
+def _resolve_name(path: str) -> str:
+    """Entity display name for a path — paths are static per camera model."""
+    return ENTITY_NAMES.get(path) or _path_to_name(path)
+
+
+# Lowercase→uppercase boundary inside a camelCase tag
+_CAMEL_RE = re.compile(r"(?<=[a-z])(?=[A-Z])")
 
 
 def _path_to_name(path: str) -> str:
@@ -342,9 +540,4 @@ def _path_to_name(path: str) -> str:
     """
     last = path.rsplit("/", 1)[-1]
     # Insert spaces before uppercase letters: "generalLevel" → "general Level"
-    name = ""
-    for i, ch in enumerate(last):
-        if ch.isupper() and i > 0 and last[i - 1].islower():
-            name += " "
-        name += ch
-    return name.replace("_", " ").title()
+    return _CAMEL_RE.sub(" ", last).replace("_", " ").title()
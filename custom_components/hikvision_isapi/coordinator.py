@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections import defaultdict
 from datetime import timedelta
+import hashlib
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, DefaultDict, Dict, List, Optional
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .capabilities import EntityDescriptor, parse_capabilities, _build_value_map, _strip_ns
+from .capabilities import EntityDescriptor, EntityType, parse_capabilities, _build_value_map
 from .const import DEFAULT_SCAN_INTERVAL, DOMAIN
 from .isapi_client import DeviceInfo, ISAPIClient
 
@@ -30,11 +33,24 @@ class HikvisionISAPICoordinator(DataUpdateCoordinator):
             _LOGGER,
             name=f"{DOMAIN}_{device_info.unique_id}",
             update_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+            # Only notify entities when the value map actually changed
+            always_update=False,
         )
         self.client = client
         self.device_info = device_info
         self.entity_descriptors: List[EntityDescriptor] = []
+        self.entity_by_path: Dict[str, EntityDescriptor] = {}
+        # Descriptors bucketed by platform, so each platform's setup takes
+        # its own list instead of filtering the full one
+        self.descriptors_by_type: DefaultDict[
+            EntityType, List[EntityDescriptor]
+        ] = defaultdict(list)
+        # Merged mode selects whose value must be derived when the tag is absent
+        self._linked_descriptors: List[EntityDescriptor] = []
         self._capabilities_fetched = False
+        # Digest of the last parsed current-values XML and its flattened map
+        self._last_values_hash: Optional[bytes] = None
+        self._last_value_map: Dict[str, str] = {}
 
     async def _async_update_data(self) -> Dict[str, str]:
         """Fetch current values from the camera.
@@ -44,26 +60,53 @@ class HikvisionISAPICoordinator(DataUpdateCoordinator):
         """
         try:
             if not self._capabilities_fetched:
-                caps_xml = await self.client.get_capabilities()
-                values_xml = await self.client.get_current_values()
+                # Independent GETs — fetch them concurrently
+                caps_xml, values_xml = await asyncio.gather(
+                    self.client.get_capabilities(),
+                    self.client.get_current_values(),
+                )
                 self.entity_descriptors = parse_capabilities(caps_xml, values_xml)
+                self.entity_by_path = {e.path: e for e in self.entity_descriptors}
+                self.descriptors_by_type = defaultdict(list)
+                for e in self.entity_descriptors:
+                    self.descriptors_by_type[e.entity_type].append(e)
+                self._linked_descriptors = [
+                    e for e in self.entity_descriptors
+                    if e.linked_enabled_path is not None
+                ]
                 self._capabilities_fetched = True
                 return {e.path: e.current_value for e in self.entity_descriptors}
 
             values_xml = await self.client.get_current_values()
+            values_hash = hashlib.blake2b(values_xml, digest_size=8).digest()
+            if values_hash == self._last_values_hash:
+                # Camera settings unchanged since last poll — skip the parse.
+                # Return a copy: entities write optimistic values into data.
+                return dict(self._last_value_map)
+
             value_map = _build_value_map(values_xml)
 
-            # Update entity descriptors with fresh values
-            for entity in self.entity_descriptors:
-                if entity.path in value_map:
-                    entity.current_value = value_map[entity.path]
-                elif entity.linked_enabled_path is not None:
+            # Update only the descriptors whose value changed since last poll
+            previous = self._last_value_map
+            changed = {
+                path: value
+                for path, value in value_map.items()
+                if previous.get(path) != value
+            }
+            for path, value in changed.items():
+                entity = self.entity_by_path.get(path)
+                if entity is not None:
+                    entity.current_value = value
+            for entity in self._linked_descriptors:
+                if entity.path not in value_map:
                     # Mode tag absent from XML — feature is disabled
                     enabled = value_map.get(entity.linked_enabled_path, "")
                     if enabled.lower() != "true" and entity.off_value:
                         entity.current_value = entity.off_value
 
-            return value_map
+            self._last_values_hash = values_hash
+            self._last_value_map = value_map
+            return dict(value_map)
 
         except Exception as err:
             raise UpdateFailed(f"Error communicating with camera: {err}") from err
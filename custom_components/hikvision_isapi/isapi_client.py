@@ -16,19 +16,44 @@ require. Raw string manipulation is the only reliable approach.
 
 from __future__ import annotations
 
+import asyncio
 import logging
-import re
-import xml.etree.ElementTree as ET
+import time
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Optional, Tuple
 
 import httpx
 
+from .capabilities import ET, _LXML, _iterparse, _release, _strip_ns
+
+if _LXML:
+    # Comments/PIs would otherwise show up as children with non-string tags
+    _XML_PARSER = ET.XMLParser(
+        huge_tree=False,
+        remove_blank_text=True,
+        remove_comments=True,
+        remove_pis=True,
+        resolve_entities=False,
+    )
+else:
+    _XML_PARSER = None
+
 _LOGGER = logging.getLogger(__name__)
 
 ISAPI_NS = "http://www.hikvision.com/ver20/XMLSchema"
 NS = {"ns": ISAPI_NS}
+# Byte values that can follow a tag name inside an opening tag
+_TAG_NAME_END = frozenset(b" \t\r\n>")
 TIMEOUT = 10.0
+# httpx drops idle connections after 5 s by default — keep them across polls
+KEEPALIVE_EXPIRY = 60.0
+# A single camera never needs more than a handful of concurrent requests
+MAX_CONNECTIONS = 4
+# How long a fetched ImageChannel document may stand in for a fresh GET.
+# Short on purpose: it only needs to cover a burst of entity writes.
+IMAGE_XML_CACHE_TTL = 2.0
+# How long submit() waits for other entity writes to join the same PUT
+BATCH_WINDOW = 0.025
 
 
 @dataclass
@@ -57,10 +82,14 @@ class PutResult:
     sub_status: str  # e.g., "WDRNotDisable", "ok", "deviceError"
 
     @classmethod
-    def from_xml(cls, root: ET.Element, http_status: int) -> PutResult:
-        """Parse a ResponseStatus XML into a PutResult."""
-        status_str = _text(root, "ns:statusString")
-        sub_status = _text(root, "ns:subStatusCode", "ok")
+    def from_response(cls, content: bytes, http_status: int) -> PutResult:
+        """Build a PutResult from a raw ResponseStatus body.
+
+        The schema is fixed and only two leaves matter, so they are sliced
+        straight out of the bytes rather than parsing the document.
+        """
+        status_str = _extract_tag(content, "statusString")
+        sub_status = _extract_tag(content, "subStatusCode") or "ok"
         success = status_str == "OK" and http_status == 200
         return cls(
             success=success,
@@ -77,34 +106,66 @@ class ISAPIClient:
         self.base_url = f"http://{host}"
         self.channel = channel
         self._auth = httpx.DigestAuth(username, password)
-        self._client: Optional[httpx.AsyncClient] = None
-
-    async def _ensure_client(self) -> httpx.AsyncClient:
-        if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(
-                auth=self._auth,
-                timeout=TIMEOUT,
-                follow_redirects=True,
-            )
-        return self._client
+        # One long-lived client per camera: polls and writes reuse the same
+        # keep-alive socket, and the shared DigestAuth replays the cached
+        # challenge instead of eating a 401 round trip each time.
+        self._client = httpx.AsyncClient(
+            auth=self._auth,
+            timeout=TIMEOUT,
+            follow_redirects=True,
+            transport=httpx.AsyncHTTPTransport(
+                limits=httpx.Limits(
+                    max_connections=MAX_CONNECTIONS,
+                    max_keepalive_connections=MAX_CONNECTIONS,
+                    keepalive_expiry=KEEPALIVE_EXPIRY,
+                ),
+                retries=1,
+            ),
+        )
+        # (raw ImageChannel XML, time.monotonic() it was fetched or written).
+        # Only filled by GETs and PUTs made under _write_lock.
+        self._image_xml_cache: Optional[Tuple[bytes, float]] = None
+        # Bumped whenever a poll invalidates the cache, so a write-side GET
+        # that was in flight meanwhile doesn't re-fill it with an older copy
+        self._image_xml_generation = 0
+        # Held across each GET-modify-PUT cycle on the ImageChannel document
+        self._write_lock = asyncio.Lock()
+        # Writes queued by submit() for the next batched PUT
+        self._pending: Dict[str, str] = {}
+        # (path, future) per submit() call waiting on the batch
+        self._pending_futures: List[Tuple[str, asyncio.Future[PutResult]]] = []
+        self._batch_task: Optional[asyncio.Task[None]] = None
+        # Learned per camera by the prerequisite engine: whether a blocker
+        # change and its target can go in one PUT (keyed by the paths set)
+        self._combined_put_ok: Dict[FrozenSet[str], bool] = {}
+
+    async def __aenter__(self) -> ISAPIClient:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
 
     async def close(self) -> None:
-        if self._client and not self._client.is_closed:
+        if self._batch_task is not None:
+            self._batch_task.cancel()
+            self._batch_task = None
+        for _, future in self._pending_futures:
+            future.cancel()
+        self._pending.clear()
+        self._pending_futures.clear()
+        if not self._client.is_closed:
             await self._client.aclose()
-            self._client = None
 
     async def _get(self, path: str) -> ET.Element:
-        client = await self._ensure_client()
         url = f"{self.base_url}{path}"
-        resp = await client.get(url)
+        resp = await self._client.get(url)
         resp.raise_for_status()
-        return ET.fromstring(resp.content)
+        return _parse_xml(resp.content)
 
     async def _get_raw(self, path: str) -> bytes:
         """GET and return raw bytes (preserves XML exactly as camera sends it)."""
-        client = await self._ensure_client()
         url = f"{self.base_url}{path}"
-        resp = await client.get(url)
+        resp = await self._client.get(url)
         resp.raise_for_status()
         return resp.content
 
@@ -120,15 +181,67 @@ class ISAPIClient:
             device_name=_text(root, "ns:deviceName"),
         )
 
-    async def get_capabilities(self) -> ET.Element:
-        """Fetch image capabilities XML for the channel."""
-        return await self._get(
+    async def get_capabilities(self) -> bytes:
+        """Fetch raw image capabilities XML for the channel."""
+        return await self._get_raw(
             f"/ISAPI/Image/channels/{self.channel}/capabilities"
         )
 
-    async def get_current_values(self) -> ET.Element:
-        """Fetch current image settings XML for the channel."""
-        return await self._get(f"/ISAPI/Image/channels/{self.channel}")
+    async def get_current_values(self) -> bytes:
+        """Fetch raw current image settings XML for the channel."""
+        raw = await self._get_raw(f"/ISAPI/Image/channels/{self.channel}")
+        # A poll isn't serialised with writes, so its document may predate a
+        # PUT that finished while it was in flight. Drop the RMW cache rather
+        # than fill it; the next write fetches a fresh copy.
+        self._image_xml_cache = None
+        self._image_xml_generation += 1
+        return raw
+
+    async def _get_image_channel(self) -> bytes:
+        """GET the full ImageChannel XML for a read-modify-write.
+
+        Must be called with _write_lock held. Reuses the document from a GET
+        or PUT made within the last IMAGE_XML_CACHE_TTL seconds, so a burst of
+        writes doesn't re-fetch it before every PUT.
+        """
+        cached = self._image_xml_cache
+        if cached is not None and time.monotonic() - cached[1] < IMAGE_XML_CACHE_TTL:
+            return cached[0]
+        generation = self._image_xml_generation
+        raw = await self._get_raw(f"/ISAPI/Image/channels/{self.channel}")
+        if generation == self._image_xml_generation:
+            self._image_xml_cache = (raw, time.monotonic())
+        return raw
+
+    async def _put_image_channel(self, content: bytes) -> PutResult:
+        """PUT a full ImageChannel document and parse the ResponseStatus."""
+        url = f"{self.base_url}/ISAPI/Image/channels/{self.channel}"
+        resp = await self._client.put(
+            url,
+            content=content,
+            headers={"Content-Type": "application/xml"},
+        )
+
+        result = PutResult.from_response(resp.content, resp.status_code)
+
+        # On success the camera now holds exactly what we sent; on failure
+        # we no longer know its state, so force the next RMW to re-fetch.
+        if result.success:
+            self._image_xml_cache = (content, time.monotonic())
+        else:
+            self._image_xml_cache = None
+        return result
+
+    def combined_put_allowed(self, paths: Iterable[str]) -> bool:
+        """Whether these paths may be tried together in one PUT.
+
+        True until the camera has rejected that exact combination.
+        """
+        return self._combined_put_ok.get(frozenset(paths), True)
+
+    def record_combined_put(self, paths: Iterable[str], ok: bool) -> None:
+        """Remember whether the camera accepted these paths in one PUT."""
+        self._combined_put_ok[frozenset(paths)] = ok
 
     async def put_setting(
         self, path: str, value: str
@@ -140,8 +253,57 @@ class ISAPIClient:
         """
         return await self.put_settings({path: value})
 
+    async def submit(self, path: str, value: str) -> PutResult:
+        """Set a single ISAPI setting, batched with other concurrent writes.
+
+        Writes submitted within BATCH_WINDOW of each other are merged into one
+        put_settings() call, so toggling several entities at once costs a
+        single read-modify-write. If a path is submitted twice, the later
+        value wins.
+
+        If the batched PUT fails, each path is re-issued on its own, so every
+        caller gets the result for its own change rather than an error that
+        may belong to another path in the batch.
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[PutResult] = loop.create_future()
+        self._pending[path] = value
+        self._pending_futures.append((path, future))
+        if self._batch_task is None:
+            self._batch_task = loop.create_task(self._flush_batch())
+        return await future
+
+    async def _flush_batch(self) -> None:
+        """Wait out the batch window, then PUT everything queued so far."""
+        await asyncio.sleep(BATCH_WINDOW)
+        changes, self._pending = self._pending, {}
+        futures, self._pending_futures = self._pending_futures, []
+        # Writes submitted from here on start the next batch, which queues
+        # behind this one on the write lock
+        self._batch_task = None
+
+        try:
+            result = await self.put_settings(changes)
+        except Exception as err:
+            _settle(futures, error=err)
+            return
+        if result.success or len(changes) == 1:
+            _settle(futures, result=result)
+            return
+
+        # The camera rejects the whole document for one bad or conflicting
+        # value — find out which by re-issuing each change separately
+        for path, value in changes.items():
+            waiting = [entry for entry in futures if entry[0] == path]
+            try:
+                path_result = await self.put_settings({path: value})
+            except Exception as err:
+                _settle(waiting, error=err)
+            else:
+                _settle(waiting, result=path_result)
+
     async def put_settings(
-        self, changes: Dict[str, str]
+        self, changes: Mapping[str, str]
     ) -> PutResult:
         """Set multiple ISAPI settings in a single PUT.
 
@@ -149,52 +311,37 @@ class ISAPIClient:
         camera sends (including repeated xmlns declarations on child elements).
         ET.tostring() mangles these, causing the camera to reject with deviceError.
         """
-        # Read current full XML
-        raw = await self._get_raw(
-            f"/ISAPI/Image/channels/{self.channel}"
-        )
-        xml_str = raw.decode("utf-8")
-
-        # Parse a copy with ET to find current values (read-only)
-        tree = ET.fromstring(raw)
-
-        for path, new_value in changes.items():
-            element = _find_by_path(tree, path)
-            if element is None:
-                _LOGGER.warning("Path not found in XML: %s", path)
-                continue
-
-            old_value = element.text or ""
-            if old_value == new_value:
-                _LOGGER.debug("Skipping %s (already %s)", path, new_value)
-                continue
-
-            _LOGGER.debug("Setting %s = %s (was %s)", path, new_value, old_value)
-            xml_str = _raw_replace(xml_str, path, old_value, new_value)
-            # Update ET tree so subsequent changes see updated values
-            element.text = new_value
-
-        # PUT the minimally-modified XML back
-        client = await self._ensure_client()
-        url = f"{self.base_url}/ISAPI/Image/channels/{self.channel}"
-        resp = await client.put(
-            url,
-            content=xml_str.encode("utf-8"),
-            headers={"Content-Type": "application/xml"},
-        )
-
-        root = ET.fromstring(resp.content)
-        result = PutResult.from_xml(root, resp.status_code)
+        # Serialise RMW cycles so concurrent writers can't clobber each other
+        async with self._write_lock:
+            # Read current full XML. It stays bytes end to end — the edits
+            # below are byte-level, so it is never decoded or re-encoded.
+            raw = await self._get_image_channel()
+
+            # Entities re-assert state on refresh, so writes are often
+            # no-ops — check the raw text before paying for a parse and PUT
+            if all(
+                _raw_value(raw, path) == new_value.encode()
+                for path, new_value in changes.items()
+            ):
+                _LOGGER.debug("Skipping PUT, already set: %s", changes)
+                return PutResult(success=True, status_code=200, sub_status="ok")
+
+            # Parsing and rewriting the document is CPU-bound — do it in a
+            # worker thread so the event loop stays responsive meanwhile
+            xml = await asyncio.to_thread(_compute_edits, raw, changes)
+
+            # PUT the minimally-modified XML back
+            result = await self._put_image_channel(xml)
+
+            if not result.success:
+                _LOGGER.warning(
+                    "PUT failed for %s: %s (HTTP %d)",
+                    changes,
+                    result.sub_status,
+                    result.status_code,
+                )
 
-        if not result.success:
-            _LOGGER.warning(
-                "PUT failed for %s: %s (HTTP %d)",
-                changes,
-                result.sub_status,
-                result.status_code,
-            )
-
-        return result
+            return result
 
     async def put_setting_with_enable(
         self,
@@ -207,70 +354,105 @@ class ISAPIClient:
         Handles the case where the mode tag doesn't exist in the XML when
         the feature is disabled (e.g., BLCMode disappears when BLC is off).
         """
-        raw = await self._get_raw(
-            f"/ISAPI/Image/channels/{self.channel}"
-        )
-        xml_str = raw.decode("utf-8")
-        tree = ET.fromstring(raw)
-
-        # Set enabled=true
-        enabled_elem = _find_by_path(tree, enabled_path)
-        if enabled_elem is not None:
-            old_enabled = enabled_elem.text or ""
-            if old_enabled != "true":
+        async with self._write_lock:
+            xml = await self._get_image_channel()
+            current_values = _read_values(xml, (enabled_path, mode_path))
+
+            # Set enabled=true
+            old_enabled = current_values.get(enabled_path)
+            if old_enabled is not None and old_enabled != "true":
                 _LOGGER.debug(
                     "Setting %s = true (was %s)", enabled_path, old_enabled
                 )
-                xml_str = _raw_replace(
-                    xml_str, enabled_path, old_enabled, "true"
+                xml = _raw_replace(xml, enabled_path, old_enabled, "true")
+
+            # Set or insert mode value
+            old_mode = current_values.get(mode_path)
+            if old_mode is not None:
+                _LOGGER.debug(
+                    "Setting %s = %s (was %s)", mode_path, mode_value, old_mode
+                )
+                xml = _raw_replace(xml, mode_path, old_mode, mode_value)
+            else:
+                _LOGGER.debug(
+                    "Inserting %s = %s (tag was absent)", mode_path, mode_value
+                )
+                xml = _raw_insert_after(xml, enabled_path, mode_path, mode_value)
+
+            # PUT
+            result = await self._put_image_channel(xml)
+
+            if not result.success:
+                _LOGGER.warning(
+                    "PUT failed for enable %s + %s=%s: %s (HTTP %d)",
+                    enabled_path,
+                    mode_path,
+                    mode_value,
+                    result.sub_status,
+                    result.status_code,
                 )
 
-        # Set or insert mode value
-        mode_elem = _find_by_path(tree, mode_path)
-        if mode_elem is not None:
-            old_mode = mode_elem.text or ""
-            _LOGGER.debug(
-                "Setting %s = %s (was %s)", mode_path, mode_value, old_mode
-            )
-            xml_str = _raw_replace(
-                xml_str, mode_path, old_mode, mode_value
-            )
+            return result
+
+
+def _settle(
+    futures: List[Tuple[str, asyncio.Future[PutResult]]],
+    result: Optional[PutResult] = None,
+    error: Optional[BaseException] = None,
+) -> None:
+    """Resolve batched submit() futures with a result or an exception."""
+    for _, future in futures:
+        if future.done():
+            continue
+        if error is not None:
+            future.set_exception(error)
         else:
-            _LOGGER.debug(
-                "Inserting %s = %s (tag was absent)", mode_path, mode_value
-            )
-            xml_str = _raw_insert_after(
-                xml_str, enabled_path, mode_path, mode_value
-            )
-
-        # PUT
-        client = await self._ensure_client()
-        url = f"{self.base_url}/ISAPI/Image/channels/{self.channel}"
-        resp = await client.put(
-            url,
-            content=xml_str.encode("utf-8"),
-            headers={"Content-Type": "application/xml"},
-        )
+            future.set_result(result)
 
-        root = ET.fromstring(resp.content)
-        result = PutResult.from_xml(root, resp.status_code)
 
-        if not result.success:
-            _LOGGER.warning(
-                "PUT failed for enable %s + %s=%s: %s (HTTP %d)",
-                enabled_path,
-                mode_path,
-                mode_value,
-                result.sub_status,
-                result.status_code,
-            )
+def _compute_edits(raw: bytes, changes: Mapping[str, str]) -> bytes:
+    """Return raw with every change in `changes` applied.
 
-        return result
+    Pure and synchronous, so put_settings can run it off the event loop.
+    Paths that can't be found are logged and left untouched.
+    """
+    # Stream just the targeted leaves' current text — no full tree
+    current_values = _read_values(raw, changes)
+
+    # Locate every change against the original document, then rewrite
+    # it once — rather than rescanning the whole string per change
+    edits: List[Tuple[int, int, bytes]] = []
+    # Checked once per call, not per change; still follows runtime
+    # log-level changes
+    debug = _LOGGER.isEnabledFor(logging.DEBUG)
+    for path, new_value in changes.items():
+        old_value = current_values.get(path)
+        if old_value is None:
+            _LOGGER.warning("Path not found in XML: %s", path)
+            continue
+
+        if old_value == new_value:
+            if debug:
+                _LOGGER.debug("Skipping %s (already %s)", path, new_value)
+            continue
+
+        span = _locate(raw, path, old_value)
+        if span is None:
+            _LOGGER.warning("Could not locate %s in raw XML", path)
+            continue
+
+        if debug:
+            _LOGGER.debug("Setting %s = %s (was %s)", path, new_value, old_value)
+        edits.append((span[0], span[1], new_value.encode()))
+        # Record it so subsequent changes see updated values
+        current_values[path] = new_value
+
+    return _apply_edits(raw, edits)
 
 
 def _raw_insert_after(
-    xml_str: str, after_path: str, new_path: str, new_value: str
-) -> str:
+    xml: bytes, after_path: str, new_path: str, new_value: str
+) -> bytes:
     """Insert a new XML element after an existing one, within parent scope.
 
     Used when a tag (like BLCMode) doesn't exist in the XML and needs to
@@ -282,100 +464,213 @@ def _raw_insert_after(
 
     if len(after_parts) >= 2:
         parent_tag = after_parts[-2]
-        parent_open = re.search(
-            rf"<{re.escape(parent_tag)}[\s>]", xml_str
-        )
-        if parent_open:
-            close_tag = f"</{parent_tag}>"
-            close_pos = xml_str.find(close_tag, parent_open.start())
+        parent_start, _ = _find_open_tag(xml, parent_tag)
+        if parent_start != -1:
+            close_tag = f"</{parent_tag}>".encode()
+            close_pos = xml.find(close_tag, parent_start)
             if close_pos != -1:
-                # Find the closing tag of the "after" element within parent
-                block = xml_str[parent_open.start():close_pos]
-                after_close = f"</{after_tag}>"
-                after_close_pos = block.find(after_close)
+                # Find the closing tag of the "after" element within parent,
+                # searching in place rather than slicing the block out
+                after_close = f"</{after_tag}>".encode()
+                after_close_pos = xml.find(after_close, parent_start, close_pos)
                 if after_close_pos != -1:
-                    abs_pos = (
-                        parent_open.start()
-                        + after_close_pos
-                        + len(after_close)
-                    )
-                    new_element = f"\n<{new_tag}>{new_value}</{new_tag}>"
+                    abs_pos = after_close_pos + len(after_close)
+                    new_element = f"\n<{new_tag}>{new_value}</{new_tag}>".encode()
                     return (
-                        xml_str[:abs_pos]
+                        xml[:abs_pos]
                         + new_element
-                        + xml_str[abs_pos:]
+                        + xml[abs_pos:]
                     )
 
     _LOGGER.warning("Could not insert %s after %s", new_path, after_path)
-    return xml_str
+    return xml
 
 
-def _raw_replace(xml_str: str, path: str, old_value: str, new_value: str) -> str:
+def _raw_replace(xml: bytes, path: str, old_value: str, new_value: str) -> bytes:
     """Replace an element's text value in raw XML, using parent context.
 
     For a path like "BLC/enabled", finds the <BLC> block first, then replaces
     <enabled>old</enabled> within that block. This prevents accidentally
     changing <enabled> in a different section (e.g., HLC/enabled).
     """
+    span = _locate(xml, path, old_value)
+    if span is None:
+        return xml
+    return _apply_edits(xml, [(span[0], span[1], new_value.encode())])
+
+
+def _locate(
+    xml: bytes, path: str, old_value: Optional[str] = None
+) -> Optional[Tuple[int, int]]:
+    """Find the (start, end) span of an element's text in raw XML.
+
+    Scoped to the immediate parent block like _raw_replace, falling back to
+    the first matching leaf anywhere in the document. With old_value=None
+    the first leaf with that tag matches regardless of its text.
+
+    Tags are located with plain bytes.find rather than regexes — the edit is
+    a literal tag-bounded substring swap, so the regex engine buys nothing.
+    """
     parts = path.split("/")
     leaf_tag = parts[-1]
-    leaf_pat = (
-        rf"(<{re.escape(leaf_tag)}(?:\s[^>]*)?>)"
-        rf"{re.escape(old_value)}"
-        rf"(</{re.escape(leaf_tag)}>)"
-    )
-    replacement = rf"\g<1>{new_value}\g<2>"
+    old = None if old_value is None else old_value.encode()
 
     if len(parts) >= 2:
-        # Scope the replacement within the immediate parent block
-        parent_tag = parts[-2]
-        parent_open = re.search(
-            rf"<{re.escape(parent_tag)}[\s>]", xml_str
-        )
-        if parent_open:
-            close_tag = f"</{parent_tag}>"
-            close_pos = xml_str.find(close_tag, parent_open.start())
-            if close_pos != -1:
-                block_end = close_pos + len(close_tag)
-                block = xml_str[parent_open.start():block_end]
-                new_block = re.sub(leaf_pat, replacement, block, count=1)
-                if new_block != block:
-                    return (
-                        xml_str[:parent_open.start()]
-                        + new_block
-                        + xml_str[block_end:]
-                    )
+        block = _parent_block(xml, parts[-2])
+        if block is not None:
+            span = _find_leaf_value(xml, leaf_tag, old, *block)
+            if span is not None:
+                return span
 
-    # Fallback: replace first match globally
-    return re.sub(leaf_pat, replacement, xml_str, count=1)
+    return _find_leaf_value(xml, leaf_tag, old, 0, len(xml))
 
 
-def _find_by_path(root: ET.Element, path: str) -> Optional[ET.Element]:
-    """Find an element by slash-separated path, handling namespaces.
+def _raw_value(xml: bytes, path: str) -> Optional[bytes]:
+    """Read an element's current text straight from raw XML.
 
-    Path like "Exposure/OverexposeSuppress/enabled" finds the element
-    regardless of XML namespace prefixes.
+    Unlike _locate there is no document-wide fallback: if the parent block
+    isn't there, the element can't be pinned down and None is returned.
     """
     parts = path.split("/")
-    current = root
-    for part in parts:
-        found = None
-        for child in current:
-            tag = _strip_ns(child.tag)
-            if tag == part:
-                found = child
-                break
-        if found is None:
+    if len(parts) >= 2:
+        block = _parent_block(xml, parts[-2])
+        if block is None:
+            return None
+    else:
+        block = (0, len(xml))
+    span = _find_leaf_value(xml, parts[-1], None, *block)
+    return None if span is None else xml[span[0]:span[1]]
+
+
+def _parent_block(xml: bytes, parent_tag: str) -> Optional[Tuple[int, int]]:
+    """Span from the first <parent_tag> opener through its closing tag."""
+    parent_start, _ = _find_open_tag(xml, parent_tag)
+    if parent_start == -1:
+        return None
+    close_tag = f"</{parent_tag}>".encode()
+    close_pos = xml.find(close_tag, parent_start)
+    if close_pos == -1:
+        return None
+    return parent_start, close_pos + len(close_tag)
+
+
+def _find_leaf_value(
+    xml: bytes,
+    leaf_tag: str,
+    old_value: Optional[bytes],
+    start: int,
+    end: int,
+) -> Optional[Tuple[int, int]]:
+    """Span of the first <leaf_tag> text in xml[start:end] equal to old_value.
+
+    old_value=None accepts the first <leaf_tag> that holds plain text.
+    """
+    close_tag = f"</{leaf_tag}>".encode()
+    pos = start
+    while True:
+        _, value_start = _find_open_tag(xml, leaf_tag, pos, end)
+        if value_start == -1:
+            return None
+        value_end = xml.find(close_tag, value_start, end)
+        if value_end == -1:
             return None
-        current = found
-    return current
+        if old_value is None:
+            if xml.find(b"<", value_start, value_end) == -1:
+                return value_start, value_end
+        elif (
+            value_end - value_start == len(old_value)
+            and xml.startswith(old_value, value_start)
+        ):
+            return value_start, value_end
+        pos = value_end + len(close_tag)
+
+
+def _apply_edits(xml: bytes, edits: List[Tuple[int, int, bytes]]) -> bytes:
+    """Apply (start, end, new_text) replacements to xml in one pass.
+
+    Spans refer to the original document. An edit overlapping an earlier one
+    (two paths resolving to the same element) is dropped.
+    """
+    parts: List[bytes] = []
+    pos = 0
+    for start, end, new_text in sorted(edits):
+        if start < pos:
+            continue
+        parts.append(xml[pos:start])
+        parts.append(new_text)
+        pos = end
+    parts.append(xml[pos:])
+    return b"".join(parts)
+
+
+def _find_open_tag(
+    xml: bytes, tag: str, start: int = 0, end: Optional[int] = None
+) -> Tuple[int, int]:
+    """Locate the first opening <tag> or <tag attr="..."> in xml[start:end].
+
+    Returns (index of "<", index just past ">"), or (-1, -1) if absent.
+    Longer tags sharing the prefix (<tagX>) and self-closing <tag/> are skipped.
+    """
+    needle = b"<" + tag.encode()
+    if end is None:
+        end = len(xml)
+    pos = xml.find(needle, start, end)
+    while pos != -1:
+        after = pos + len(needle)
+        if after < end and xml[after] in _TAG_NAME_END:
+            gt = xml.find(b">", after, end)
+            if gt == -1:
+                break
+            if xml[gt - 1:gt] != b"/":
+                return pos, gt + 1
+        pos = xml.find(needle, after, end)
+    return -1, -1
 
 
-def _strip_ns(tag: str) -> str:
-    """Strip XML namespace: {http://...}Tag → Tag."""
-    if tag.startswith("{"):
-        return tag.split("}", 1)[1]
-    return tag
+def _read_values(xml: bytes, paths: Iterable[str]) -> Dict[str, str]:
+    """Read the current text of each slash path from raw XML in one pass.
+
+    Streams with iterparse instead of building a tree: only the wanted leaves
+    are recorded, elements are cleared as they close, and parsing stops once
+    every path has been seen. Paths absent from the document are left out.
+    """
+    wanted = {tuple(path.split("/")): path for path in paths}
+    values: Dict[str, str] = {}
+    # Tag names of the open elements below the root
+    stack: List[str] = []
+    depth = 0
+    for event, element in _iterparse(xml):
+        if event == "start":
+            if depth:
+                stack.append(_strip_ns(element.tag))
+            depth += 1
+            continue
+        depth -= 1
+        if depth:
+            path = wanted.get(tuple(stack))
+            if path is not None and path not in values:
+                values[path] = element.text or ""
+                if len(values) == len(wanted):
+                    break
+            stack.pop()
+        _release(element)
+    return values
+
+
+def _extract_tag(xml: bytes, tag: str) -> str:
+    """Stripped text of the first <tag> in raw XML, or "" if absent."""
+    _, value_start = _find_open_tag(xml, tag)
+    if value_start == -1:
+        return ""
+    value_end = xml.find(f"</{tag}>".encode(), value_start)
+    if value_end == -1:
+        return ""
+    return xml[value_start:value_end].strip().decode("utf-8", "replace")
+
+
+def _parse_xml(data: bytes) -> ET.Element:
+    """Parse XML bytes with lxml when available, else stdlib ElementTree."""
+    return ET.fromstring(data, _XML_PARSER)
 
 
 def _text(element: ET.Element, xpath: str, default: str = "") -> str:
@@ -27,8 +27,7 @@ async def async_setup_entry(
 
     entities = [
         HikvisionISAPINumber(coordinator, descriptor)
-        for descriptor in coordinator.entity_descriptors
-        if descriptor.entity_type == EntityType.NUMBER
+        for descriptor in coordinator.descriptors_by_type[EntityType.NUMBER]
     ]
     async_add_entities(entities)
 
@@ -43,25 +42,37 @@ class HikvisionISAPINumber(HikvisionISAPIEntity, NumberEntity):
         self._attr_native_min_value = descriptor.min_value or 0
         self._attr_native_max_value = descriptor.max_value or 100
         self._attr_native_step = 1.0
+        # Last raw string seen by native_value and its parsed float, so
+        # unchanged values don't go back through float() on every read
+        self._cached_raw: str | None = None
+        self._cached_float: float | None = None
 
     @property
     def native_value(self) -> float | None:
         """Return the current value."""
         val = self._current_value
+        if val == self._cached_raw:
+            return self._cached_float
+        parsed = None
         if val:
             try:
-                return float(val)
+                parsed = float(val)
             except ValueError:
-                return None
-        return None
+                pass
+        self._cached_raw = val
+        self._cached_float = parsed
+        return parsed
 
     async def async_set_native_value(self, value: float) -> None:
         """Set a new value via ISAPI."""
         str_value = str(int(value))
-        result = await self.coordinator.client.put_setting(
+        if str_value == self._current_value:
+            return
+        result = await self.coordinator.client.submit(
             self._descriptor.path, str_value
         )
         if result.success:
+            self._cached_raw = self._cached_float = None
             # Optimistic update
             self.coordinator.data[self._descriptor.path] = str_value
             self.async_write_ha_state()
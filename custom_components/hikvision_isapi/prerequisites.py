@@ -12,15 +12,19 @@ Tested conflicts (from DS-2CD2187G2-LSU and PCI-D18Z2HS):
   - HLC and BLC can coexist
   - Error codes: WDRNotDisable, MutexWithWDR, HLCNotDisable, BLCNotDisable
 
-IMPORTANT: The camera validates conflicts against its CURRENT state, not the
-PUT body. So disabling a blocker and enabling the target must be done in two
-sequential PUTs — a single combined PUT is rejected.
+IMPORTANT: The tested cameras validate conflicts against their CURRENT state,
+not the PUT body. So disabling a blocker and enabling the target must be done
+in two sequential PUTs — a single combined PUT is rejected. Other firmwares
+may accept the combined PUT, so it is tried once per combination and the
+outcome remembered on the client; the two-PUT sequence is the fallback.
 """
 
 from __future__ import annotations
 
+from functools import lru_cache
 import logging
-from typing import Dict, Optional, TYPE_CHECKING
+from types import MappingProxyType
+from typing import Mapping, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .isapi_client import ISAPIClient, PutResult
@@ -28,27 +32,33 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 
 # Known conflict error codes → what to disable first
-# Key: subStatusCode from camera, Value: {path: value} to set BEFORE retrying
-CONFLICT_RESOLUTIONS: Dict[str, Dict[str, str]] = {
-    "WDRNotDisable": {"WDR/mode": "close"},
-    "MutexWithWDR": {"WDR/mode": "close"},
-    "HLCNotDisable": {"HLC/enabled": "false"},
-    "BLCNotDisable": {"BLC/enabled": "false"},
-}
+# Key: subStatusCode from camera, Value: {path: value} to set BEFORE retrying.
+# Read-only: the same mappings are handed out to every caller.
+CONFLICT_RESOLUTIONS: Mapping[str, Mapping[str, str]] = MappingProxyType({
+    "WDRNotDisable": MappingProxyType({"WDR/mode": "close"}),
+    "MutexWithWDR": MappingProxyType({"WDR/mode": "close"}),
+    "HLCNotDisable": MappingProxyType({"HLC/enabled": "false"}),
+    "BLCNotDisable": MappingProxyType({"BLC/enabled": "false"}),
+})
 
 # MutexWithWDR is ambiguous — returned both when enabling something while WDR
 # is on AND when enabling WDR while something else is on.  When the path being
 # set IS WDR, the actual blockers are BLC/HLC, not WDR itself.
-_WDR_REVERSE_RESOLUTION: Dict[str, str] = {
+_WDR_REVERSE_RESOLUTION: Mapping[str, str] = MappingProxyType({
     "BLC/enabled": "false",
     "HLC/enabled": "false",
-}
+})
 
 MAX_RETRIES = 2
 
 
-def _get_resolution(sub_status: str, path: str) -> Optional[Dict[str, str]]:
-    """Get the right conflict resolution for a given error and target path."""
+@lru_cache(maxsize=64)
+def _get_resolution(sub_status: str, path: str) -> Optional[Mapping[str, str]]:
+    """Get the right conflict resolution for a given error and target path.
+
+    Memoized, so the returned mapping is shared — it is read-only and must
+    not be mutated by callers.
+    """
     resolution = CONFLICT_RESOLUTIONS.get(sub_status)
     if resolution is None:
         return None
@@ -67,11 +77,13 @@ async def put_with_prerequisites(
     """Set a value, auto-resolving conflicts if needed.
 
     1. Try the PUT directly
-    2. If it fails with a known conflict code, disable the blocker in a
-       separate PUT first, then retry the original change
+    2. If it fails with a known conflict code, disable the blocker and set
+       the value in one PUT, unless this camera is known to reject that
+    3. Otherwise disable the blocker in a separate PUT first, then retry the
+       original change
     """
-    # First attempt: just set the value
-    result = await client.put_setting(path, value)
+    # First attempt: just set the value (batched with any concurrent writes)
+    result = await client.submit(path, value)
 
     if result.success:
         return result
@@ -96,6 +108,18 @@ async def put_with_prerequisites(
             value,
         )
 
+        # Fast path: blocker and target together, if the camera allows it
+        combined = {**resolution, path: value}
+        if client.combined_put_allowed(combined):
+            result = await client.put_settings(combined)
+            client.record_combined_put(combined, result.success)
+            if result.success:
+                return result
+            _LOGGER.debug(
+                "Combined PUT rejected (%s) — falling back to two PUTs",
+                result.sub_status,
+            )
+
         # Step 1: Disable the blocker in its own PUT
         prereq_result = await client.put_settings(resolution)
         if not prereq_result.success:
@@ -28,8 +28,7 @@ async def async_setup_entry(
 
     entities = [
         HikvisionISAPISelect(coordinator, descriptor)
-        for descriptor in coordinator.entity_descriptors
-        if descriptor.entity_type == EntityType.SELECT
+        for descriptor in coordinator.descriptors_by_type[EntityType.SELECT]
     ]
     async_add_entities(entities)
 
@@ -39,14 +38,10 @@ class HikvisionISAPISelect(HikvisionISAPIEntity, SelectEntity):
 
     def __init__(self, coordinator, descriptor):
         super().__init__(coordinator, descriptor)
-        # Build the raw → friendly mapping and expose friendly names as options
-        self._raw_to_friendly = dict(
-            zip(descriptor.options, descriptor.friendly_options)
-        )
-        self._friendly_to_raw = dict(
-            zip(descriptor.friendly_options, descriptor.options)
-        )
-        self._attr_options = descriptor.friendly_options
+        # Raw ↔ friendly lookups are prebuilt and shared via the descriptor
+        self._raw_to_friendly = descriptor.raw_to_friendly
+        self._friendly_to_raw = descriptor.friendly_to_raw
+        self._attr_options = list(descriptor.friendly_options)
         # For merged mode selects (e.g., BLC Mode controls both mode and enabled)
         self._linked_enabled_path = descriptor.linked_enabled_path
         self._off_value = descriptor.off_value
@@ -28,8 +28,7 @@ async def async_setup_entry(
 
     entities = [
         HikvisionISAPISwitch(coordinator, descriptor)
-        for descriptor in coordinator.entity_descriptors
-        if descriptor.entity_type == EntityType.SWITCH
+        for descriptor in coordinator.descriptors_by_type[EntityType.SWITCH]
     ]
     async_add_entities(entities)
 